@@ -8,5 +8,3 @@ This app handles:
 - Follow-up automation
 - Activity statistics and reporting
 """
-
-default_app_config = 'apps.activities.apps.ActivitiesConfig'
\ No newline at end of file
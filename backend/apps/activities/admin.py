@@ -7,7 +7,88 @@ from django.utils.html import format_html
 from django.utils import timezone
 from django.db.models import Count
 
-from .models import ActivityType, Activity, Task, InteractionLog, FollowUpRule
+from apps.common.paginators import LargeTablePaginator
+
+from .models import (
+    ActivityType, Activity, Task, InteractionLog, FollowUpRule, bulk_create_follow_ups
+)
+from .signals import handle_bulk_activity_completion, handle_bulk_task_completion
+
+
+DEFAULT_BADGE_COLOR = '#6B7280'
+
+PRIORITY_COLORS = {
+    'low': '#6B7280',
+    'medium': '#F59E0B',
+    'high': '#EF4444',
+    'urgent': '#DC2626'
+}
+
+ACTIVITY_STATUS_COLORS = {
+    'scheduled': '#3B82F6',
+    'in_progress': '#F59E0B',
+    'completed': '#10B981',
+    'cancelled': '#6B7280',
+    'overdue': '#EF4444'
+}
+
+TASK_STATUS_COLORS = {
+    'todo': '#F59E0B',
+    'in_progress': '#3B82F6',
+    'completed': '#10B981',
+    'cancelled': '#6B7280'
+}
+
+INTERACTION_TYPE_ICONS = {
+    'call_inbound': '📞',
+    'call_outbound': '📲',
+    'email_sent': '📧',
+    'email_received': '📨',
+    'meeting': '🤝',
+    'note': '📝',
+    'sms': '💬',
+    'other': '📋'
+}
+
+
+def render_badge(color, label):
+    """Colored, bold label used for status and priority columns."""
+    return format_html(
+        '<span style="color: {}; font-weight: bold;">{}</span>',
+        color,
+        label
+    )
+
+
+def render_badges(choices, colors):
+    """Render the badge for every choice once, at import time."""
+    return {
+        value: render_badge(colors.get(value, DEFAULT_BADGE_COLOR), label)
+        for value, label in choices
+    }
+
+
+ACTIVITY_STATUS_BADGES = render_badges(Activity.STATUS_CHOICES, ACTIVITY_STATUS_COLORS)
+ACTIVITY_PRIORITY_BADGES = render_badges(Activity.PRIORITY_CHOICES, PRIORITY_COLORS)
+TASK_STATUS_BADGES = render_badges(Task.STATUS_CHOICES, TASK_STATUS_COLORS)
+TASK_PRIORITY_BADGES = render_badges(Task.PRIORITY_CHOICES, PRIORITY_COLORS)
+INTERACTION_TYPE_LABELS = {
+    value: format_html('{} {}', INTERACTION_TYPE_ICONS.get(value, '📋'), label)
+    for value, label in InteractionLog.INTERACTION_TYPES
+}
+
+
+class ChangelistDeferMixin:
+    """Defer long text columns on the changelist, which never renders them."""
+    changelist_defer = ()
+    
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        match = request.resolver_match
+        changelist_url_name = f'{self.opts.app_label}_{self.opts.model_name}_changelist'
+        if self.changelist_defer and match and match.url_name == changelist_url_name:
+            queryset = queryset.defer(*self.changelist_defer)
+        return queryset
 
 
 @admin.register(ActivityType)
@@ -41,13 +122,14 @@ class ActivityTypeAdmin(admin.ModelAdmin):
     
     def get_queryset(self, request):
         return super().get_queryset(request).annotate(
-            activities_count=Count('activities')
+            activities_total=Count('activities')
         )
     
     def activities_count(self, obj):
         """Display number of activities for this type."""
-        return obj.activities_count
+        return obj.activities_total
     activities_count.short_description = 'Activities'
+    activities_count.admin_order_field = 'activities_total'
     
     def color_display(self, obj):
         """Display color as a colored box."""
@@ -59,17 +141,28 @@ class ActivityTypeAdmin(admin.ModelAdmin):
 
 
 @admin.register(Activity)
-class ActivityAdmin(admin.ModelAdmin):
+class ActivityAdmin(ChangelistDeferMixin, admin.ModelAdmin):
     """Admin for Activity model."""
     
+    show_full_result_count = False
+    paginator = LargeTablePaginator
+    changelist_defer = ['description', 'outcome_notes']
+    
     list_display = [
         'title', 'activity_type', 'status_display', 'priority_display',
         'assigned_to', 'scheduled_at', 'contact', 'is_overdue_display'
     ]
+    list_select_related = ['activity_type', 'assigned_to', 'contact']
     list_filter = [
-        'status', 'priority', 'activity_type', 'assigned_to',
+        'status', 'priority',
+        ('activity_type', admin.RelatedOnlyFieldListFilter),
+        ('assigned_to', admin.RelatedOnlyFieldListFilter),
         'requires_follow_up', 'reminder_sent'
     ]
+    autocomplete_fields = [
+        'contact', 'company', 'opportunity', 'assigned_to',
+        'created_by', 'parent_activity'
+    ]
     search_fields = ['title', 'description', 'contact__first_name', 'contact__last_name']
     ordering = ['-scheduled_at']
     readonly_fields = ['created_at', 'updated_at', 'completed_at', 'reminder_sent']
@@ -103,43 +196,20 @@ class ActivityAdmin(admin.ModelAdmin):
         })
     )
     
-    def get_queryset(self, request):
-        return super().get_queryset(request).select_related(
-            'activity_type', 'contact', 'company', 'opportunity',
-            'assigned_to', 'created_by'
-        )
-    
     def status_display(self, obj):
         """Display status with color coding."""
-        colors = {
-            'scheduled': '#3B82F6',
-            'in_progress': '#F59E0B', 
-            'completed': '#10B981',
-            'cancelled': '#6B7280',
-            'overdue': '#EF4444'
-        }
-        color = colors.get(obj.status, '#6B7280')
-        return format_html(
-            '<span style="color: {}; font-weight: bold;">{}</span>',
-            color,
-            obj.get_status_display()
-        )
+        badge = ACTIVITY_STATUS_BADGES.get(obj.status)
+        if badge is None:
+            badge = render_badge(DEFAULT_BADGE_COLOR, obj.get_status_display())
+        return badge
     status_display.short_description = 'Status'
     
     def priority_display(self, obj):
         """Display priority with color coding."""
-        colors = {
-            'low': '#6B7280',
-            'medium': '#F59E0B',
-            'high': '#EF4444',
-            'urgent': '#DC2626'
-        }
-        color = colors.get(obj.priority, '#6B7280')
-        return format_html(
-            '<span style="color: {}; font-weight: bold;">{}</span>',
-            color,
-            obj.get_priority_display()
-        )
+        badge = ACTIVITY_PRIORITY_BADGES.get(obj.priority)
+        if badge is None:
+            badge = render_badge(DEFAULT_BADGE_COLOR, obj.get_priority_display())
+        return badge
     priority_display.short_description = 'Priority'
     
     def is_overdue_display(self, obj):
@@ -153,10 +223,28 @@ class ActivityAdmin(admin.ModelAdmin):
     
     def mark_completed(self, request, queryset):
         """Bulk action to mark activities as completed."""
-        updated = 0
-        for activity in queryset.filter(status__in=['scheduled', 'in_progress']):
-            activity.mark_completed(user=request.user)
-            updated += 1
+        activities = list(
+            queryset.filter(
+                status__in=['scheduled', 'in_progress']
+            ).select_related('activity_type').defer(None)
+        )
+        completed_at = timezone.now()
+        
+        # One UPDATE for the whole selection; post_save side effects are replayed in bulk
+        Activity.objects.filter(
+            pk__in=[activity.pk for activity in activities]
+        ).update(status='completed', completed_at=completed_at, updated_at=completed_at)
+        for activity in activities:
+            activity.status = 'completed'
+            activity.completed_at = completed_at
+        handle_bulk_activity_completion(activities)
+        
+        bulk_create_follow_ups([
+            (activity, request.user)
+            for activity in activities
+            if activity.requires_follow_up and activity.follow_up_date
+        ])
+        updated = len(activities)
         
         self.message_user(
             request,
@@ -178,14 +266,20 @@ class ActivityAdmin(admin.ModelAdmin):
 
 
 @admin.register(Task)
-class TaskAdmin(admin.ModelAdmin):
+class TaskAdmin(ChangelistDeferMixin, admin.ModelAdmin):
     """Admin for Task model."""
     
+    show_full_result_count = False
+    paginator = LargeTablePaginator
+    changelist_defer = ['description', 'completion_notes']
+    
     list_display = [
         'title', 'status_display', 'priority_display', 'assigned_to',
         'due_date', 'is_overdue_display', 'created_at'
     ]
-    list_filter = ['status', 'priority', 'assigned_to']
+    list_select_related = ['assigned_to']
+    list_filter = ['status', 'priority', ('assigned_to', admin.RelatedOnlyFieldListFilter)]
+    autocomplete_fields = ['contact', 'company', 'opportunity', 'assigned_to', 'created_by']
     search_fields = ['title', 'description', 'contact__first_name', 'contact__last_name']
     ordering = ['-created_at']
     readonly_fields = ['created_at', 'updated_at', 'completed_at']
@@ -212,42 +306,20 @@ class TaskAdmin(admin.ModelAdmin):
         })
     )
     
-    def get_queryset(self, request):
-        return super().get_queryset(request).select_related(
-            'contact', 'company', 'opportunity',
-            'assigned_to', 'created_by'
-        )
-    
     def status_display(self, obj):
         """Display status with color coding."""
-        colors = {
-            'todo': '#F59E0B',
-            'in_progress': '#3B82F6',
-            'completed': '#10B981',
-            'cancelled': '#6B7280'
-        }
-        color = colors.get(obj.status, '#6B7280')
-        return format_html(
-            '<span style="color: {}; font-weight: bold;">{}</span>',
-            color,
-            obj.get_status_display()
-        )
+        badge = TASK_STATUS_BADGES.get(obj.status)
+        if badge is None:
+            badge = render_badge(DEFAULT_BADGE_COLOR, obj.get_status_display())
+        return badge
     status_display.short_description = 'Status'
     
     def priority_display(self, obj):
         """Display priority with color coding."""
-        colors = {
-            'low': '#6B7280',
-            'medium': '#F59E0B',
-            'high': '#EF4444',
-            'urgent': '#DC2626'
-        }
-        color = colors.get(obj.priority, '#6B7280')
-        return format_html(
-            '<span style="color: {}; font-weight: bold;">{}</span>',
-            color,
-            obj.get_priority_display()
-        )
+        badge = TASK_PRIORITY_BADGES.get(obj.priority)
+        if badge is None:
+            badge = render_badge(DEFAULT_BADGE_COLOR, obj.get_priority_display())
+        return badge
     priority_display.short_description = 'Priority'
     
     def is_overdue_display(self, obj):
@@ -261,10 +333,17 @@ class TaskAdmin(admin.ModelAdmin):
     
     def mark_completed(self, request, queryset):
         """Bulk action to mark tasks as completed."""
-        updated = 0
-        for task in queryset.filter(status__in=['todo', 'in_progress']):
-            task.mark_completed()
-            updated += 1
+        tasks = list(queryset.filter(status__in=['todo', 'in_progress']).defer(None))
+        completed_at = timezone.now()
+        
+        Task.objects.filter(
+            pk__in=[task.pk for task in tasks]
+        ).update(status='completed', completed_at=completed_at, updated_at=completed_at)
+        for task in tasks:
+            task.status = 'completed'
+            task.completed_at = completed_at
+        handle_bulk_task_completion(tasks)
+        updated = len(tasks)
         
         self.message_user(
             request,
@@ -286,14 +365,24 @@ class TaskAdmin(admin.ModelAdmin):
 
 
 @admin.register(InteractionLog)
-class InteractionLogAdmin(admin.ModelAdmin):
+class InteractionLogAdmin(ChangelistDeferMixin, admin.ModelAdmin):
     """Admin for InteractionLog model."""
     
+    show_full_result_count = False
+    paginator = LargeTablePaginator
+    changelist_defer = ['notes']
+    
     list_display = [
         'title', 'interaction_type_display', 'interaction_date',
         'contact', 'company', 'logged_by', 'duration_minutes'
     ]
-    list_filter = ['interaction_type', 'logged_by', 'interaction_date']
+    list_select_related = ['contact', 'company', 'logged_by']
+    list_filter = [
+        'interaction_type',
+        ('logged_by', admin.RelatedOnlyFieldListFilter),
+        'interaction_date'
+    ]
+    autocomplete_fields = ['contact', 'company', 'opportunity', 'logged_by', 'source_activity']
     search_fields = ['title', 'notes', 'contact__first_name', 'contact__last_name']
     ordering = ['-interaction_date']
     readonly_fields = ['created_at', 'updated_at']
@@ -315,29 +404,12 @@ class InteractionLogAdmin(admin.ModelAdmin):
         })
     )
     
-    def get_queryset(self, request):
-        return super().get_queryset(request).select_related(
-            'contact', 'company', 'opportunity', 'logged_by', 'source_activity'
-        )
-    
     def interaction_type_display(self, obj):
         """Display interaction type with icon."""
-        icons = {
-            'call_inbound': '📞',
-            'call_outbound': '📲',
-            'email_sent': '📧',
-            'email_received': '📨',
-            'meeting': '🤝',
-            'note': '📝',
-            'sms': '💬',
-            'other': '📋'
-        }
-        icon = icons.get(obj.interaction_type, '📋')
-        return format_html(
-            '{} {}',
-            icon,
-            obj.get_interaction_type_display()
-        )
+        label = INTERACTION_TYPE_LABELS.get(obj.interaction_type)
+        if label is None:
+            label = format_html('{} {}', '📋', obj.get_interaction_type_display())
+        return label
     interaction_type_display.short_description = 'Type'
 
 
@@ -349,6 +421,7 @@ class FollowUpRuleAdmin(admin.ModelAdmin):
         'name', 'trigger_activity_type', 'trigger_outcome_display',
         'follow_up_activity_type', 'follow_up_delay_days', 'is_active'
     ]
+    list_select_related = ['trigger_activity_type', 'follow_up_activity_type']
     list_filter = ['is_active', 'trigger_activity_type', 'follow_up_activity_type']
     search_fields = ['name', 'description']
     ordering = ['name']
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.7 on 2026-10-17 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('activities', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['created_at'], name='activities__created_1ba72e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='interactionlog',
+            index=models.Index(fields=['interaction_date'], name='activities__interac_b0ebe8_idx'),
+        ),
+    ]
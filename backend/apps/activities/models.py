@@ -5,7 +5,9 @@ This module defines models for task management, interaction tracking,
 and follow-up activities in the CRM system.
 """
 
-from django.db import models
+import logging
+
+from django.db import models, transaction
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.utils import timezone
 from datetime import datetime, timedelta
@@ -14,6 +16,9 @@ from apps.contacts.models import Contact, Company
 from apps.opportunities.models import Opportunity
 
 
+logger = logging.getLogger(__name__)
+
+
 class ActivityType(models.Model):
     """
     Types of activities that can be performed.
@@ -71,6 +76,17 @@ class ActivityType(models.Model):
         return self.name
 
 
+class ActivityQuerySet(models.QuerySet):
+    """QuerySet helpers for loading activities with their relations."""
+
+    def with_related(self):
+        """Join the foreign keys shown in activity lists."""
+        return self.select_related(
+            'activity_type', 'contact', 'company', 'opportunity',
+            'assigned_to', 'created_by'
+        )
+
+
 class Activity(models.Model):
     """
     Core activity model for tracking interactions, tasks, and follow-ups.
@@ -247,6 +263,8 @@ class Activity(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = ActivityQuerySet.as_manager()
+
     class Meta:
         verbose_name = "Activity"
         verbose_name_plural = "Activities"
@@ -265,6 +283,11 @@ class Activity(models.Model):
 
     def save(self, *args, **kwargs):
         """Override save to handle status changes and completion."""
+        self.apply_status_rules()
+        super().save(*args, **kwargs)
+
+    def apply_status_rules(self):
+        """Apply the completion and overdue rules enforced by save()."""
         # Auto-set completed_at when status changes to completed
         if self.status == 'completed' and not self.completed_at:
             self.completed_at = timezone.now()
@@ -273,8 +296,6 @@ class Activity(models.Model):
         if (self.scheduled_at < timezone.now() and 
             self.status == 'scheduled'):
             self.status = 'overdue'
-        
-        super().save(*args, **kwargs)
 
     @property
     def is_overdue(self):
@@ -310,24 +331,59 @@ class Activity(models.Model):
         if self.requires_follow_up and self.follow_up_date:
             self.create_follow_up_activity(user or self.assigned_to)
 
-    def create_follow_up_activity(self, user):
-        """Create a follow-up activity."""
-        follow_up = Activity.objects.create(
+    def build_follow_up_activity(self, user):
+        """Build (unsaved) the follow-up activity for this activity."""
+        return Activity(
             title=f"Follow-up: {self.title}",
             description=f"Follow-up for: {self.description}",
-            activity_type=self.activity_type,
+            activity_type_id=self.activity_type_id,
             scheduled_at=self.follow_up_date,
             priority=self.priority,
-            contact=self.contact,
-            company=self.company,
-            opportunity=self.opportunity,
-            assigned_to=self.assigned_to,
+            contact_id=self.contact_id,
+            company_id=self.company_id,
+            opportunity_id=self.opportunity_id,
+            assigned_to_id=self.assigned_to_id,
             created_by=user,
             parent_activity=self
         )
+
+    def create_follow_up_activity(self, user):
+        """Create a follow-up activity."""
+        follow_up = self.build_follow_up_activity(user)
+        follow_up.save()
         return follow_up
 
 
+def bulk_insert_activities(activities, batch_size=1000):
+    """
+    Insert unsaved activities with bulk_create.
+    
+    bulk_create() bypasses save(), so its status rules are applied here.
+    """
+    for activity in activities:
+        activity.apply_status_rules()
+    return Activity.objects.bulk_create(activities, batch_size=batch_size)
+
+
+def bulk_create_follow_ups(pairs, batch_size=1000):
+    """Create follow-ups for (source_activity, user) pairs in bulk."""
+    return bulk_insert_activities(
+        [source_activity.build_follow_up_activity(user) for source_activity, user in pairs],
+        batch_size=batch_size
+    )
+
+
+class TaskQuerySet(models.QuerySet):
+    """QuerySet helpers for loading tasks with their relations."""
+
+    def with_related(self):
+        """Join the foreign keys shown in task lists."""
+        return self.select_related(
+            'contact', 'company', 'opportunity',
+            'assigned_to', 'created_by'
+        )
+
+
 class Task(models.Model):
     """
     Simple task model for to-do items and personal tasks.
@@ -439,6 +495,8 @@ class Task(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = TaskQuerySet.as_manager()
+
     class Meta:
         verbose_name = "Task"
         verbose_name_plural = "Tasks"
@@ -447,6 +505,7 @@ class Task(models.Model):
             models.Index(fields=['assigned_to', 'status']),
             models.Index(fields=['due_date']),
             models.Index(fields=['priority', 'due_date']),
+            models.Index(fields=['created_at']),
         ]
 
     def __str__(self):
@@ -468,6 +527,19 @@ class Task(models.Model):
         self.save()
 
 
+class InteractionLogQuerySet(models.QuerySet):
+    """QuerySet helpers for loading interaction logs with their relations."""
+
+    def with_related(self):
+        """Join the foreign keys shown in interaction lists, including the source activity's."""
+        return self.select_related(
+            'contact', 'company', 'opportunity', 'logged_by',
+            'source_activity__activity_type', 'source_activity__contact',
+            'source_activity__company', 'source_activity__opportunity',
+            'source_activity__assigned_to'
+        )
+
+
 class InteractionLog(models.Model):
     """
     Log of all interactions with contacts/companies.
@@ -565,11 +637,14 @@ class InteractionLog(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = InteractionLogQuerySet.as_manager()
+
     class Meta:
         verbose_name = "Interaction Log"
         verbose_name_plural = "Interaction Logs"
         ordering = ['-interaction_date']
         indexes = [
+            models.Index(fields=['interaction_date']),
             models.Index(fields=['contact', 'interaction_date']),
             models.Index(fields=['company', 'interaction_date']),
             models.Index(fields=['opportunity', 'interaction_date']),
@@ -580,6 +655,53 @@ class InteractionLog(models.Model):
         return f"{self.title} - {self.interaction_date.strftime('%Y-%m-%d %H:%M')}"
 
 
+class FollowUpRuleManager(models.Manager):
+    """Manager for follow-up rules."""
+
+    def bulk_apply(self, rule, source_activities, batch_size=1000):
+        """
+        Create the follow-ups of one rule for many source activities.
+        
+        A source whose follow-up fails is logged and skipped; the others are
+        still created.
+        """
+        follow_ups = []
+        for source_activity in source_activities:
+            try:
+                follow_ups.append(rule.build_follow_up(source_activity))
+            except Exception:
+                logger.exception(
+                    "Error building follow-up for rule %s from activity %s",
+                    rule.name, source_activity.pk
+                )
+        
+        try:
+            with transaction.atomic():
+                return bulk_insert_activities(follow_ups, batch_size=batch_size)
+        except Exception:
+            logger.exception(
+                "Bulk follow-up insert failed for rule %s; creating them one by one",
+                rule.name
+            )
+        
+        created = []
+        for follow_up in follow_ups:
+            # A rolled-back batch may have assigned primary keys already
+            follow_up.pk = None
+            follow_up._state.adding = True
+            try:
+                with transaction.atomic():
+                    follow_up.save()
+            except Exception:
+                logger.exception(
+                    "Error creating follow-up for rule %s from activity %s",
+                    rule.name, follow_up.parent_activity_id
+                )
+            else:
+                created.append(follow_up)
+        return created
+
+
 class FollowUpRule(models.Model):
     """
     Rules for automated follow-up creation.
@@ -644,6 +766,8 @@ class FollowUpRule(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = FollowUpRuleManager()
+
     class Meta:
         verbose_name = "Follow-up Rule"
         verbose_name_plural = "Follow-up Rules"
@@ -652,8 +776,8 @@ class FollowUpRule(models.Model):
     def __str__(self):
         return self.name
 
-    def create_follow_up(self, source_activity):
-        """Create a follow-up activity based on this rule."""
+    def build_follow_up(self, source_activity):
+        """Build (unsaved) a follow-up activity based on this rule."""
         follow_up_date = timezone.now() + timedelta(days=self.follow_up_delay_days)
         
         title = self.follow_up_title_template.format(
@@ -666,18 +790,22 @@ class FollowUpRule(models.Model):
             outcome=source_activity.get_outcome_display()
         )
         
-        follow_up = Activity.objects.create(
+        return Activity(
             title=title,
             description=description,
-            activity_type=self.follow_up_activity_type,
+            activity_type_id=self.follow_up_activity_type_id,
             scheduled_at=follow_up_date,
             priority=source_activity.priority,
-            contact=source_activity.contact,
-            company=source_activity.company,
-            opportunity=source_activity.opportunity,
-            assigned_to=source_activity.assigned_to,
-            created_by=source_activity.assigned_to,  # Auto-created
+            contact_id=source_activity.contact_id,
+            company_id=source_activity.company_id,
+            opportunity_id=source_activity.opportunity_id,
+            assigned_to_id=source_activity.assigned_to_id,
+            created_by_id=source_activity.assigned_to_id,  # Auto-created
             parent_activity=source_activity
         )
-        
+
+    def create_follow_up(self, source_activity):
+        """Create a follow-up activity based on this rule."""
+        follow_up = self.build_follow_up(source_activity)
+        follow_up.save()
         return follow_up
\ No newline at end of file
@@ -15,6 +15,35 @@ from datetime import timedelta
 from .models import Activity, Task, InteractionLog, FollowUpRule
 
 
+# Map activity type to interaction type
+INTERACTION_TYPE_BY_ACTIVITY_TYPE = {
+    'Call': 'call_outbound',
+    'Email': 'email_sent',
+    'Meeting': 'meeting',
+    'Task': 'other',
+    'Note': 'note'
+}
+
+
+def build_activity_completion_log(activity):
+    """Build (unsaved) the interaction log recorded for a completed activity."""
+    return InteractionLog(
+        title=f"Completed: {activity.title}",
+        interaction_type=INTERACTION_TYPE_BY_ACTIVITY_TYPE.get(
+            activity.activity_type.name,
+            'other'
+        ),
+        notes=f"Activity completed. Outcome: {activity.get_outcome_display()}. Notes: {activity.outcome_notes}",
+        interaction_date=activity.completed_at or timezone.now(),
+        duration_minutes=activity.duration_minutes,
+        contact_id=activity.contact_id,
+        company_id=activity.company_id,
+        opportunity_id=activity.opportunity_id,
+        logged_by_id=activity.assigned_to_id,
+        source_activity=activity
+    )
+
+
 @receiver(post_save, sender=Activity)
 def handle_activity_completion(sender, instance, created, **kwargs):
     """
@@ -30,37 +59,32 @@ def handle_activity_completion(sender, instance, created, **kwargs):
             ).exists()
             
             if not existing_log:
-                # Map activity type to interaction type
-                interaction_type_mapping = {
-                    'Call': 'call_outbound',
-                    'Email': 'email_sent',
-                    'Meeting': 'meeting',
-                    'Task': 'other',
-                    'Note': 'note'
-                }
-                
-                interaction_type = interaction_type_mapping.get(
-                    instance.activity_type.name,
-                    'other'
-                )
-                
-                InteractionLog.objects.create(
-                    title=f"Completed: {instance.title}",
-                    interaction_type=interaction_type,
-                    notes=f"Activity completed. Outcome: {instance.get_outcome_display()}. Notes: {instance.outcome_notes}",
-                    interaction_date=instance.completed_at or timezone.now(),
-                    duration_minutes=instance.duration_minutes,
-                    contact=instance.contact,
-                    company=instance.company,
-                    opportunity=instance.opportunity,
-                    logged_by=instance.assigned_to,
-                    source_activity=instance
-                )
+                build_activity_completion_log(instance).save()
         
         # Apply automatic follow-up rules
         apply_follow_up_rules(instance)
 
 
+def handle_bulk_activity_completion(activities):
+    """
+    Counterpart of handle_activity_completion for activities completed
+    with QuerySet.update(), which sends no post_save.
+    """
+    linked = [activity for activity in activities if activity.contact_id or activity.company_id]
+    already_logged = set(
+        InteractionLog.objects.filter(
+            source_activity__in=linked
+        ).values_list('source_activity_id', flat=True)
+    )
+    InteractionLog.objects.bulk_create([
+        build_activity_completion_log(activity)
+        for activity in linked
+        if activity.pk not in already_logged
+    ])
+    
+    apply_bulk_follow_up_rules(activities)
+
+
 @receiver(pre_save, sender=Activity)
 def handle_activity_status_change(sender, instance, **kwargs):
     """
@@ -107,6 +131,28 @@ def handle_task_completion(sender, instance, created, **kwargs):
             )
 
 
+def handle_bulk_task_completion(tasks):
+    """
+    Counterpart of handle_task_completion for tasks completed with
+    QuerySet.update(). Each log carries the new completion time, so there
+    is no earlier identical log for get_or_create to find.
+    """
+    InteractionLog.objects.bulk_create([
+        InteractionLog(
+            title=f"Task Completed: {task.title}",
+            interaction_type='other',
+            notes=f"Task completed. Notes: {task.completion_notes}",
+            interaction_date=task.completed_at or timezone.now(),
+            contact_id=task.contact_id,
+            company_id=task.company_id,
+            opportunity_id=task.opportunity_id,
+            logged_by_id=task.assigned_to_id
+        )
+        for task in tasks
+        if task.contact_id or task.company_id
+    ])
+
+
 def apply_follow_up_rules(activity):
     """
     Apply automatic follow-up rules for a completed activity.
@@ -129,6 +175,32 @@ def apply_follow_up_rules(activity):
             print(f"Error creating follow-up for rule {rule.name}: {e}")
 
 
+def apply_bulk_follow_up_rules(activities):
+    """
+    Apply automatic follow-up rules for many completed activities,
+    inserting each rule's follow-ups with a single bulk_create.
+    """
+    with_outcome = [activity for activity in activities if activity.outcome]
+    if not with_outcome:
+        return
+    
+    rules = FollowUpRule.objects.filter(
+        is_active=True,
+        trigger_activity_type__in={activity.activity_type_id for activity in with_outcome},
+        trigger_outcome__in={activity.outcome for activity in with_outcome}
+    )
+    
+    for rule in rules:
+        sources = [
+            activity for activity in with_outcome
+            if activity.activity_type_id == rule.trigger_activity_type_id
+            and activity.outcome == rule.trigger_outcome
+        ]
+        # bulk_apply logs and skips sources that fail, so one bad activity
+        # doesn't cost the rest of the batch their follow-ups
+        FollowUpRule.objects.bulk_apply(rule, sources)
+
+
 # Reminder System (could be moved to a separate service)
 
 def send_activity_reminders():
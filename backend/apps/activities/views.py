@@ -127,10 +127,9 @@ class ActivityViewSet(viewsets.ModelViewSet):
     
     def get_queryset(self):
         """Get activities with optimized queries."""
-        queryset = Activity.objects.select_related(
-            'activity_type', 'contact', 'company', 'opportunity',
-            'assigned_to', 'created_by'
-        ).prefetch_related('follow_up_activities')
+        queryset = Activity.objects.with_related().prefetch_related(
+            'follow_up_activities'
+        )
         
         # Filter by date range
         start_date = self.request.query_params.get('start_date')
@@ -369,10 +368,7 @@ class TaskViewSet(viewsets.ModelViewSet):
     
     def get_queryset(self):
         """Get tasks with optimized queries."""
-        queryset = Task.objects.select_related(
-            'contact', 'company', 'opportunity',
-            'assigned_to', 'created_by'
-        )
+        queryset = Task.objects.with_related()
         
         # Filter by due date range
         start_date = self.request.query_params.get('start_date')
@@ -572,10 +568,7 @@ class InteractionLogViewSet(viewsets.ModelViewSet):
     
     def get_queryset(self):
         """Get interaction logs with optimized queries."""
-        queryset = InteractionLog.objects.select_related(
-            'contact', 'company', 'opportunity',
-            'logged_by', 'source_activity'
-        )
+        queryset = InteractionLog.objects.with_related()
         
         # Filter by date range
         start_date = self.request.query_params.get('start_date')
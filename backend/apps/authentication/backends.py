@@ -22,7 +22,8 @@ class TenantAuthenticationBackend(BaseBackend):
         try:
             with schema_context(tenant.schema_name):
                 UserModel = get_user_model()
-                user = UserModel.objects.get(email=username, is_active=True)
+                # Emails are stored lowercased, so an exact match hits the unique index
+                user = UserModel.objects.get(email=username.lower(), is_active=True)
                 
                 if user.check_password(password):
                     return user
@@ -8,7 +8,7 @@ from django.contrib.auth import authenticate
 from django.contrib.auth.models import AnonymousUser
 from django.http import HttpResponse
 from django.conf import settings
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import patch
 
 from apps.authentication.middleware import TenantOnlyAuthenticationMiddleware
 from apps.authentication.backends import TenantAuthenticationBackend
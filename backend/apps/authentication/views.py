@@ -38,7 +38,8 @@ class CustomLoginView(APIView):
                 # Import the tenant user model directly instead of using get_user_model()
                 from apps.users.models import CustomUser as TenantUserModel
                 
-                user = TenantUserModel.objects.get(email=email, is_active=True)
+                # Emails are stored lowercased, so an exact match hits the unique index
+                user = TenantUserModel.objects.get(email=email.lower(), is_active=True)
                 
                 if user.check_password(password):
                     # User authenticated successfully
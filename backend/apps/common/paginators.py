@@ -0,0 +1,29 @@
+from django.core.paginator import Paginator
+from django.db import connection
+from django.utils.functional import cached_property
+
+
+class LargeTablePaginator(Paginator):
+    """
+    Paginator that uses the planner's row estimate for unfiltered querysets
+    on large tables instead of running COUNT(*) over the whole table.
+    """
+    estimate_threshold = 10000
+
+    @cached_property
+    def count(self):
+        query = getattr(self.object_list, 'query', None)
+        if query is None or query.where:
+            return super().count
+
+        # to_regclass resolves against the search_path, i.e. the current tenant schema
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(%s)",
+                [self.object_list.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+
+        if row is None or row[0] < self.estimate_threshold:
+            return super().count
+        return row[0]
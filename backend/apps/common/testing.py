@@ -0,0 +1,6 @@
+"""
+Shared helpers for the apps' test suites.
+"""
+
+# Hashing strength is irrelevant to the tests; MD5 keeps user creation cheap
+FAST_PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
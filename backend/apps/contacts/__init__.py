@@ -1,2 +1 @@
 # Contacts app initialization
-default_app_config = 'apps.contacts.apps.ContactsConfig'
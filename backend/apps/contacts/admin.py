@@ -3,17 +3,46 @@ Django admin configuration for Contacts app.
 """
 
 from django.contrib import admin
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Count
+from apps.common.paginators import LargeTablePaginator
 from .models import Company, Contact, ContactTag, ContactTagAssignment
 
 
+class TagFilter(admin.SimpleListFilter):
+    """Tag filter populated from the tag table rather than the assignment join"""
+    title = 'tag'
+    parameter_name = 'tag'
+    cache_timeout = 60
+    
+    def lookups(self, request, model_admin):
+        cache_key = f'contacts:admin:tag_lookups:{connection.schema_name}'
+        lookups = cache.get(cache_key)
+        if lookups is None:
+            lookups = list(ContactTag.objects.order_by('name').values_list('id', 'name'))
+            cache.set(cache_key, lookups, self.cache_timeout)
+        return lookups
+    
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(tag_id=self.value())
+        return queryset
+
+
 @admin.register(Company)
 class CompanyAdmin(admin.ModelAdmin):
     """Admin interface for Company model"""
     
+    show_full_result_count = False
+    paginator = LargeTablePaginator
+    
     list_display = [
         'name', 'industry', 'size', 'city', 'country', 
         'created_at', 'created_by'
     ]
+    # created_by is nullable, so the admin's default select_related() would skip it
+    list_select_related = ['created_by']
     
     list_filter = [
         'industry', 'size', 'country', 'created_at'
@@ -61,6 +90,9 @@ class CompanyAdmin(admin.ModelAdmin):
 class ContactAdmin(admin.ModelAdmin):
     """Admin interface for Contact model"""
     
+    show_full_result_count = False
+    paginator = LargeTablePaginator
+    
     list_display = [
         'last_name', 'first_name', 'email', 'company_name', 
         'contact_type', 'score', 'is_active', 'created_at'
@@ -106,6 +138,10 @@ class ContactAdmin(admin.ModelAdmin):
         obj.updated_by = request.user
         super().save_model(request, obj, form, change)
     
+    def get_queryset(self, request):
+        """Fetch company in the changelist query"""
+        return super().get_queryset(request).select_related('company')
+    
     def company_name(self, obj):
         """Display company name in list view"""
         return obj.company.name if obj.company else "-"
@@ -135,6 +171,8 @@ class ContactTagAdmin(admin.ModelAdmin):
     """Admin interface for ContactTag model"""
     
     list_display = ['name', 'color', 'contact_count', 'created_at', 'created_by']
+    # created_by is nullable, so the admin's default select_related() would skip it
+    list_select_related = ['created_by']
     search_fields = ['name']
     readonly_fields = ['created_at', 'created_by']
     
@@ -146,18 +184,30 @@ class ContactTagAdmin(admin.ModelAdmin):
             obj.created_by = request.user
         super().save_model(request, obj, form, change)
     
+    def get_queryset(self, request):
+        """Annotate contact counts in a single query"""
+        return super().get_queryset(request).annotate(
+            _contact_count=Count('contact_assignments')
+        )
+    
     def contact_count(self, obj):
         """Display number of contacts with this tag"""
-        return obj.contact_assignments.count()
+        return obj._contact_count
     contact_count.short_description = "Contact Count"
+    contact_count.admin_order_field = '_contact_count'
 
 
 @admin.register(ContactTagAssignment)
 class ContactTagAssignmentAdmin(admin.ModelAdmin):
     """Admin interface for ContactTagAssignment model"""
     
+    show_full_result_count = False
+    paginator = LargeTablePaginator
+    
     list_display = ['contact', 'tag', 'assigned_at', 'assigned_by']
-    list_filter = ['tag', 'assigned_at']
+    # All three FKs are nullable, so the admin's default select_related() would skip them
+    list_select_related = ['contact', 'tag', 'assigned_by']
+    list_filter = [TagFilter, 'assigned_at']
     search_fields = ['contact__first_name', 'contact__last_name', 'tag__name']
     readonly_fields = ['assigned_at', 'assigned_by']
     
@@ -238,14 +238,13 @@ class ContactCreateUpdateSerializer(serializers.ModelSerializer):
             return
         
         user = self.context['request'].user
-        for tag_id in tag_ids:
-            try:
-                tag = ContactTag.objects.get(id=tag_id)
-                ContactTagAssignment.objects.get_or_create(
-                    contact=contact,
-                    tag=tag,
-                    defaults={'assigned_by': user}
-                )
-            except ContactTag.DoesNotExist:
-                # Skip invalid tag IDs
-                continue
+        # Invalid tag IDs are skipped; existing assignments are left untouched
+        # by the (contact, tag) unique constraint
+        valid_tag_ids = ContactTag.objects.filter(id__in=tag_ids).values_list('id', flat=True)
+        ContactTagAssignment.objects.bulk_create(
+            [
+                ContactTagAssignment(contact=contact, tag_id=tag_id, assigned_by=user)
+                for tag_id in valid_tag_ids
+            ],
+            ignore_conflicts=True
+        )
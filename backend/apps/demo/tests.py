@@ -66,13 +66,13 @@ class DemoRequestModelTest(TestCase):
         """Test that required fields are validated."""
         required_fields = ['company_name', 'email', 'first_name', 'last_name']
         
+        demo = DemoRequest(**self.demo_data)
         for field in required_fields:
-            demo_data = self.demo_data.copy()
-            demo_data[field] = ''
-            
-            demo = DemoRequest(**demo_data)
-            with self.assertRaises(ValidationError):
-                demo.full_clean()
+            with self.subTest(field=field):
+                setattr(demo, field, '')
+                with self.assertRaises(ValidationError):
+                    demo.clean_fields()
+                setattr(demo, field, self.demo_data[field])
     
     def test_optional_fields(self):
         """Test that optional fields can be empty."""
@@ -1,2 +1 @@
 # Opportunities app initialization
-default_app_config = 'apps.opportunities.apps.OpportunitiesConfig'
\ No newline at end of file
@@ -113,6 +113,8 @@ class OpportunityAdmin(admin.ModelAdmin):
         'created_at', 'updated_at', 'created_by', 'updated_by'
     ]
     raw_id_fields = ['contact', 'company', 'owner']
+    # company is nullable, so the admin's default select_related() would skip it
+    list_select_related = ['contact', 'company', 'stage', 'owner']
     date_hierarchy = 'created_at'
     ordering = ['-created_at']
     inlines = [OpportunityHistoryInline]
@@ -213,6 +215,11 @@ class OpportunityHistoryAdmin(admin.ModelAdmin):
         'old_value', 'new_value', 'old_probability', 'new_probability',
         'changed_by', 'created_at'
     ]
+    # Opportunity.__str__ renders its company, contact and stage
+    list_select_related = [
+        'opportunity__contact', 'opportunity__company', 'opportunity__stage',
+        'changed_by', 'old_stage', 'new_stage'
+    ]
     date_hierarchy = 'created_at'
     ordering = ['-created_at']
     
@@ -299,9 +299,14 @@ class Opportunity(models.Model):
     @property
     def days_in_stage(self):
         """Calculate days since last stage change"""
-        latest_history = self.history.order_by('-created_at').first()
-        if latest_history:
-            return (timezone.now().date() - latest_history.created_at.date()).days
+        # Querysets can annotate latest_history_at to avoid a lookup per row
+        if hasattr(self, 'latest_history_at'):
+            latest_change = self.latest_history_at
+        else:
+            latest_history = self.history.order_by('-created_at').first()
+            latest_change = latest_history.created_at if latest_history else None
+        if latest_change:
+            return (timezone.now().date() - latest_change.date()).days
         return (timezone.now().date() - self.created_at.date()).days
 
     @property
@@ -2,7 +2,10 @@
 Working tests for opportunities app.
 """
 from django.test import TestCase
-from django_tenants.test.cases import TenantTestCase
+from django.test.utils import CaptureQueriesContext
+from django.db import connection
+from rest_framework.test import APIRequestFactory, force_authenticate
+from django_tenants.test.cases import FastTenantTestCase
 from django_tenants.utils import get_tenant_model, get_tenant_domain_model
 from django.contrib.auth import get_user_model
 from decimal import Decimal
@@ -11,9 +14,10 @@ from django.utils import timezone
 
 from apps.contacts.models import Contact, Company
 from apps.opportunities.models import SalesStage, Opportunity, OpportunityHistory
+from apps.opportunities.views import OpportunityViewSet
 from apps.users.models import CustomUser
 
-class SalesStageModelTest(TenantTestCase):
+class SalesStageModelTest(FastTenantTestCase):
     """Test SalesStage model functionality."""
 
     def setUp(self):
@@ -21,7 +25,6 @@ class SalesStageModelTest(TenantTestCase):
         # You can access self.tenant here if you need it
         self.user = CustomUser.objects.create_user(
             email="test@example.com",
-            password="testpass123",
             first_name="Test",
             last_name="User",
         )
@@ -61,7 +64,7 @@ class SalesStageModelTest(TenantTestCase):
         self.assertTrue(stage.is_closed)
 
 
-class OpportunityModelTest(TenantTestCase):
+class OpportunityModelTest(FastTenantTestCase):
     """Test Opportunity model functionality within tenant schema."""
 
     def setUp(self):
@@ -70,7 +73,6 @@ class OpportunityModelTest(TenantTestCase):
         # Create user
         self.user = CustomUser.objects.create_user(
             email="test@example.com",
-            password="testpass123",
             first_name="Test",
             last_name="User",
         )
@@ -118,14 +120,21 @@ class OpportunityModelTest(TenantTestCase):
         self.assertEqual(opportunity.stage, self.stage)
         self.assertEqual(opportunity.probability, 25.00)  # From stage
 
+    def build_opportunity(self, **overrides):
+        """Build an unsaved opportunity for tests that only exercise computed properties."""
+        fields = {
+            "name": "Test Deal",
+            "value": Decimal("10000.00"),
+            "contact": self.contact,
+            "stage": self.stage,
+            "owner": self.user,
+        }
+        fields.update(overrides)
+        return Opportunity(**fields)
+
     def test_weighted_value_calculation(self):
         """Test weighted value calculation."""
-        opportunity = Opportunity.objects.create(
-            name="Test Deal",
-            value=Decimal("10000.00"),
-            contact=self.contact,
-            stage=self.stage,
-            owner=self.user,
+        opportunity = self.build_opportunity(
             probability=50.00,  # Override stage probability
         )
 
@@ -136,24 +145,18 @@ class OpportunityModelTest(TenantTestCase):
         """Test overdue detection."""
         # Create overdue opportunity
         past_date = date.today() - timedelta(days=5)
-        overdue_opportunity = Opportunity.objects.create(
+        overdue_opportunity = self.build_opportunity(
             name="Overdue Deal",
             value=Decimal("5000.00"),
-            contact=self.contact,
-            stage=self.stage,
-            owner=self.user,
             expected_close_date=past_date,
         )
         self.assertTrue(overdue_opportunity.is_overdue)
 
         # Create future opportunity
         future_date = date.today() + timedelta(days=10)
-        future_opportunity = Opportunity.objects.create(
+        future_opportunity = self.build_opportunity(
             name="Future Deal",
             value=Decimal("7500.00"),
-            contact=self.contact,
-            stage=self.stage,
-            owner=self.user,
             expected_close_date=future_date,
         )
         self.assertFalse(future_opportunity.is_overdue)
@@ -180,11 +183,13 @@ class OpportunityModelTest(TenantTestCase):
 
         # Verify stage change
         opportunity.refresh_from_db()
-        self.assertEqual(opportunity.stage, new_stage)
+        self.assertEqual(opportunity.stage_id, new_stage.pk)
         self.assertEqual(opportunity.probability, 50.00)
 
-        # Verify history was created
-        history = OpportunityHistory.objects.filter(opportunity=opportunity).first()
+        # Verify history was created; load the compared FKs in the same query
+        history = OpportunityHistory.objects.select_related(
+            "old_stage", "new_stage", "changed_by"
+        ).filter(opportunity=opportunity).first()
         self.assertIsNotNone(history)
         self.assertEqual(history.old_stage, self.stage)
         self.assertEqual(history.new_stage, new_stage)
@@ -216,7 +221,7 @@ class OpportunityModelTest(TenantTestCase):
         self.assertIsNotNone(opportunity.actual_close_date)
         self.assertEqual(opportunity.actual_close_date, timezone.now().date())
 
-class OpportunityHistoryTest(TenantTestCase):
+class OpportunityHistoryTest(FastTenantTestCase):
     """Test OpportunityHistory model functionality."""
     
     def setUp(self):
@@ -224,7 +229,6 @@ class OpportunityHistoryTest(TenantTestCase):
         """Set up test data."""
         self.user = CustomUser.objects.create_user(
             email='test@example.com',
-            password='testpass123',
             first_name='Test',
             last_name='User'
         )
@@ -305,7 +309,7 @@ class OpportunityHistoryTest(TenantTestCase):
         self.assertEqual(history.new_probability, 50.00)
 
 
-class OpportunityQueryTest(TenantTestCase):
+class OpportunityQueryTest(FastTenantTestCase):
     """Test opportunity querysets and filtering."""
     
     def setUp(self):
@@ -313,7 +317,6 @@ class OpportunityQueryTest(TenantTestCase):
         """Set up test data."""
         self.user = CustomUser.objects.create_user(
             email='test@example.com',
-            password='testpass123',
             first_name='Test',
             last_name='User'
         )
@@ -333,59 +336,69 @@ class OpportunityQueryTest(TenantTestCase):
             created_by=self.user
         )
         
-        # Create multiple stages
-        self.stage1 = SalesStage.objects.create(
-            name='Lead',
-            order=1,
-            probability=10.00,
-            created_by=self.user
-        )
-        
-        self.stage2 = SalesStage.objects.create(
-            name='Qualified',
-            order=2,
-            probability=25.00,
-            created_by=self.user
-        )
+        # Create multiple stages in one INSERT; SalesStage.save() only
+        # clamps probabilities, which these values already satisfy
+        self.stage1, self.stage2, self.closed_won = SalesStage.objects.bulk_create([
+            SalesStage(
+                name='Lead',
+                order=1,
+                probability=10.00,
+                created_by=self.user
+            ),
+            SalesStage(
+                name='Qualified',
+                order=2,
+                probability=25.00,
+                created_by=self.user
+            ),
+            SalesStage(
+                name='Closed Won',
+                order=3,
+                probability=100.00,
+                is_closed_won=True,
+                created_by=self.user
+            ),
+        ])
         
-        self.closed_won = SalesStage.objects.create(
-            name='Closed Won',
-            order=3,
-            probability=100.00,
-            is_closed_won=True,
-            created_by=self.user
-        )
-        
-        # Create test opportunities
-        Opportunity.objects.create(
-            name='Deal 1',
-            value=Decimal('5000.00'),
-            contact=self.contact,
-            stage=self.stage1,
-            owner=self.user,
-            priority='low',
-            created_by=self.user
-        )
-        
-        Opportunity.objects.create(
-            name='Deal 2',
-            value=Decimal('10000.00'),
-            contact=self.contact,
-            stage=self.stage2,
-            owner=self.user,
-            priority='high',
-            created_by=self.user
-        )
-        
-        Opportunity.objects.create(
-            name='Deal 3',
-            value=Decimal('15000.00'),
-            contact=self.contact,
-            stage=self.closed_won,
-            owner=self.user,
-            priority='medium',
-            created_by=self.user
-        )
+        # Create test opportunities in one INSERT. bulk_create skips
+        # Opportunity.save(), so company, probability and actual_close_date
+        # are set here to the values save() would derive
+        Opportunity.objects.bulk_create([
+            Opportunity(
+                name='Deal 1',
+                value=Decimal('5000.00'),
+                contact=self.contact,
+                company=self.company,
+                stage=self.stage1,
+                probability=self.stage1.probability,
+                owner=self.user,
+                priority='low',
+                created_by=self.user
+            ),
+            Opportunity(
+                name='Deal 2',
+                value=Decimal('10000.00'),
+                contact=self.contact,
+                company=self.company,
+                stage=self.stage2,
+                probability=self.stage2.probability,
+                owner=self.user,
+                priority='high',
+                created_by=self.user
+            ),
+            Opportunity(
+                name='Deal 3',
+                value=Decimal('15000.00'),
+                contact=self.contact,
+                company=self.company,
+                stage=self.closed_won,
+                probability=self.closed_won.probability,
+                actual_close_date=timezone.now().date(),
+                owner=self.user,
+                priority='medium',
+                created_by=self.user
+            ),
+        ])
     
     def test_filter_by_stage(self):
         """Test filtering opportunities by stage."""
@@ -403,4 +416,31 @@ class OpportunityQueryTest(TenantTestCase):
         """Test filtering closed opportunities."""
         closed_opps = Opportunity.objects.filter(stage__is_closed_won=True)
         self.assertEqual(closed_opps.count(), 1)
-        self.assertEqual(closed_opps.first().name, 'Deal 3')
\ No newline at end of file
+        self.assertEqual(closed_opps.first().name, 'Deal 3')
+    
+    def test_pipeline_loads_opportunity_relations_in_prefetch(self):
+        """Test the pipeline view fetches opportunity relations with the prefetch."""
+        view = OpportunityViewSet.as_view({'get': 'pipeline'})
+        request = APIRequestFactory().get('/')
+        force_authenticate(request, user=self.user)
+        
+        with CaptureQueriesContext(connection) as captured:
+            response = view(request)
+        
+        self.assertEqual(response.status_code, 200)
+        # django-tenants sets the search_path before each query; count only the queries
+        queries = [
+            query for query in captured
+            if not query['sql'].startswith('SET search_path')
+        ]
+        # One annotated stage query and one prefetch joining contact, company,
+        # owner and stage and annotating the latest history timestamp
+        self.assertEqual(len(queries), 2)
+        
+        # The annotated timestamp gives the same days_in_stage as the per-row lookup
+        for stage_data in response.data['pipeline']:
+            for opportunity in stage_data['opportunities']:
+                self.assertEqual(
+                    opportunity['days_in_stage'],
+                    Opportunity.objects.get(pk=opportunity['id']).days_in_stage
+                )
@@ -6,7 +6,7 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from django_filters.rest_framework import DjangoFilterBackend
-from django.db.models import Q, Sum, Avg, Count, F, Case, When, DecimalField
+from django.db.models import Q, Sum, Avg, Count, Max, F, Case, When, DecimalField, Prefetch
 from django.db.models.functions import Coalesce
 from django.utils import timezone
 from datetime import datetime, timedelta
@@ -250,8 +250,16 @@ class OpportunityViewSet(viewsets.ModelViewSet):
         Get pipeline view of opportunities grouped by stage.
         """
         # Get all active stages with their opportunities
+        # Prefetch each stage's opportunities with the relations the serializer
+        # renders and the latest history timestamp days_in_stage reads, so the
+        # loop below issues no per-stage or per-row queries
         stages = SalesStage.objects.filter(is_active=True).prefetch_related(
-            'opportunities'
+            Prefetch(
+                'opportunities',
+                queryset=Opportunity.objects.select_related(
+                    'contact', 'company', 'owner', 'stage'
+                ).annotate(latest_history_at=Max('history__created_at'))
+            )
         ).annotate(
             opportunities_count=Count('opportunities'),
             total_value=Coalesce(
@@ -264,7 +272,7 @@ class OpportunityViewSet(viewsets.ModelViewSet):
         
         pipeline_data = []
         for stage in stages:
-            opportunities = stage.opportunities.select_related('contact', 'company', 'owner')
+            opportunities = stage.opportunities.all()
             opportunity_serializer = OpportunitySerializer(opportunities, many=True)
             
             # Calculate weighted_value manually from the opportunities
@@ -2,6 +2,7 @@
 Admin configuration for Permissions app.
 """
 from django.contrib import admin
+from django.db.models import Count
 from django.utils.html import format_html
 from .models import Permission, Role
 
@@ -74,10 +75,17 @@ class RoleAdmin(admin.ModelAdmin):
         }),
     )
     
+    def get_queryset(self, request):
+        """Annotate permission counts in a single query"""
+        return super().get_queryset(request).annotate(
+            _permissions_count=Count('permissions')
+        )
+    
     def permissions_count(self, obj):
         """Count of permissions assigned to this role"""
-        return obj.permissions.count()
+        return obj._permissions_count
     permissions_count.short_description = 'Permissions'
+    permissions_count.admin_order_field = '_permissions_count'
     
     def status_badge(self, obj):
         """Visual status indicator"""
@@ -5,7 +5,7 @@ Tests SuperUser model and platform-level functionality.
 
 from django.test import TestCase, Client, override_settings
 from django.contrib.auth import get_user_model
-from django.db import IntegrityError
+from django.db import IntegrityError, transaction
 from django.contrib.auth.models import Permission
 from django.core.exceptions import ValidationError
 from django.contrib.admin.sites import AdminSite
@@ -16,10 +16,12 @@ from django.contrib.contenttypes.models import ContentType
 from django.urls import reverse
 import uuid
 
+from apps.common.testing import FAST_PASSWORD_HASHERS
 from apps.platform.models import SuperUser
 from apps.platform.admin import SuperUserAdmin
 
 
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS)
 class SuperUserModelTest(TestCase):
     """Test SuperUser model functionality."""
     
@@ -92,7 +94,8 @@ class SuperUserModelTest(TestCase):
         SuperUser.objects.create_user(**self.user_data)
         
         with self.assertRaises(IntegrityError):
-            SuperUser.objects.create_user(**self.user_data)
+            with transaction.atomic():
+                SuperUser.objects.create_user(**self.user_data)
     
     def test_email_required(self):
         """Test that email is required."""
@@ -168,17 +171,15 @@ class SuperUserModelTest(TestCase):
         self.assertTrue(user.is_staff)
 
 
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS)
 class SuperUserAdminTest(TestCase):
     """Test SuperUser admin functionality."""
     
-    def setUp(self):
-        """Set up test data."""
-        self.factory = RequestFactory()
-        self.admin_site = AdminSite()
-        self.admin = SuperUserAdmin(SuperUser, self.admin_site)
-        
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by all tests in the class."""
         # Create admin user
-        self.admin_user = SuperUser.objects.create_superuser(
+        cls.admin_user = SuperUser.objects.create_superuser(
             email='admin@platform.com',
             password='adminpass123',
             first_name='Admin',
@@ -186,13 +187,19 @@ class SuperUserAdminTest(TestCase):
         )
         
         # Create test user
-        self.test_user = SuperUser.objects.create_user(
+        cls.test_user = SuperUser.objects.create_user(
             email='test@platform.com',
             password='testpass123',
             first_name='Test',
             last_name='User'
         )
     
+    def setUp(self):
+        """Set up test data."""
+        self.factory = RequestFactory()
+        self.admin_site = AdminSite()
+        self.admin = SuperUserAdmin(SuperUser, self.admin_site)
+    
     def test_admin_list_display(self):
         """Test admin list display configuration."""
         expected_fields = [
@@ -234,19 +241,21 @@ class SuperUserAdminTest(TestCase):
         self.assertEqual(self.admin.ordering, ['-date_joined'])
 
 
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS)
 class SuperUserIntegrationTest(TestCase):
     """Integration tests for SuperUser with Django auth system."""
     
-    def setUp(self):
-        """Set up test data."""
-        self.superuser = SuperUser.objects.create_superuser(
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by all tests in the class."""
+        cls.superuser = SuperUser.objects.create_superuser(
             email='admin@platform.com',
             password='adminpass123',
             first_name='Admin',
             last_name='User'
         )
         
-        self.regular_user = SuperUser.objects.create_user(
+        cls.regular_user = SuperUser.objects.create_user(
             email='user@platform.com',
             password='userpass123',
             first_name='Regular',
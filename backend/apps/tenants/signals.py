@@ -0,0 +1,17 @@
+"""
+Signal handlers for tenants app.
+"""
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Tenant
+from .views import tenant_lookup_cache_key
+
+
+@receiver(post_save, sender=Tenant)
+@receiver(post_delete, sender=Tenant)
+def invalidate_tenant_lookup(sender, instance, **kwargs):
+    """Drop the cached validate_tenant result for a changed or deleted tenant."""
+    cache.delete(tenant_lookup_cache_key(instance.schema_name))
@@ -1,8 +1,18 @@
+from django.core.cache import cache
 from django.http import JsonResponse
 from django.views.decorators.http import require_http_methods
 from django.views.decorators.csrf import csrf_exempt
 from .models import Tenant
 
+# Entries are dropped by the Tenant post_save/post_delete handlers; the TTL
+# bounds staleness in processes whose cache those handlers cannot reach
+TENANT_LOOKUP_CACHE_TIMEOUT = 60
+
+
+def tenant_lookup_cache_key(subdomain):
+    """Cache key for a validate_tenant lookup."""
+    return f'tenants:validate:{subdomain}'
+
 
 @csrf_exempt
 @require_http_methods(["GET"])
@@ -11,12 +21,18 @@ def validate_tenant(request, subdomain):
     Validate if a subdomain corresponds to an existing tenant.
     This endpoint is used by the frontend middleware to check tenant validity.
     """
-    try:
-        tenant = Tenant.objects.get(schema_name=subdomain)
-        return JsonResponse({
-            'valid': True,
-            'tenant_name': tenant.name,
-            'schema_name': tenant.schema_name
-        })
-    except Tenant.DoesNotExist:
-        return JsonResponse({'valid': False}, status=404)
+    cache_key = tenant_lookup_cache_key(subdomain)
+    tenant = cache.get(cache_key)
+    
+    if tenant is None:
+        tenant = Tenant.objects.filter(schema_name=subdomain).values('name', 'schema_name').first()
+        if tenant is None:
+            # Unknown subdomains are not cached so new tenants validate immediately
+            return JsonResponse({'valid': False}, status=404)
+        cache.set(cache_key, tenant, TENANT_LOOKUP_CACHE_TIMEOUT)
+    
+    return JsonResponse({
+        'valid': True,
+        'tenant_name': tenant['name'],
+        'schema_name': tenant['schema_name']
+    })
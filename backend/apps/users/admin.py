@@ -2,6 +2,7 @@ from django.contrib import admin
 from django.contrib.auth.models import Group, Permission
 from django.utils.html import format_html
 from django.db import models
+from django.db.models import Count
 from .models import CustomUser
 
 
@@ -104,13 +105,15 @@ class CustomUserAdmin(admin.ModelAdmin):
     
     def group_count(self, obj):
         """Count of groups user belongs to"""
-        return obj.groups.count()
+        return obj._group_count
     group_count.short_description = 'Groups'
+    group_count.admin_order_field = '_group_count'
     
     def permission_count(self, obj):
         """Count of individual permissions"""
-        return obj.user_permissions.count()
+        return obj._permission_count
     permission_count.short_description = 'Individual Permissions'
+    permission_count.admin_order_field = '_permission_count'
     
     def last_login_display(self, obj):
         """Format last login date"""
@@ -146,5 +149,8 @@ class CustomUserAdmin(admin.ModelAdmin):
     
     def get_queryset(self, request):
         """Optimize queries"""
-        return super().get_queryset(request).prefetch_related('groups', 'user_permissions')
+        return super().get_queryset(request).annotate(
+            _group_count=Count('groups', distinct=True),
+            _permission_count=Count('user_permissions', distinct=True)
+        )
 
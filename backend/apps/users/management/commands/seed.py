@@ -20,6 +20,70 @@ PlatformUser = SuperUser
 # For tenant schemas
 TenantUser = CustomUser
 
+# Tenant groups created by the seed: name -> description and permission level
+DEFAULT_GROUPS = {
+    'Admin': {
+        'description': 'Full tenant administration access',
+        'permissions': 'all_tenant'
+    },
+    'Manager': {
+        'description': 'Management level access',
+        'permissions': 'management'
+    },
+    'Sales': {
+        'description': 'Sales team access',
+        'permissions': 'sales'
+    },
+    'Support': {
+        'description': 'Customer support access',
+        'permissions': 'support'
+    },
+    'User': {
+        'description': 'Basic user access',
+        'permissions': 'basic'
+    }
+}
+
+# Superuser-only permissions are excluded from tenant admins
+SUPERUSER_ONLY_CODENAMES = frozenset({
+    'add_tenant', 'change_tenant', 'delete_tenant', 'view_tenant',
+    'add_domain', 'change_domain', 'delete_domain', 'view_domain',
+})
+
+LEVEL_PERMISSION_CODENAMES = {
+    # Managers get user and content management permissions
+    'management': frozenset({
+        'view_customuser', 'add_customuser', 'change_customuser',
+        'view_contact', 'add_contact', 'change_contact', 'delete_contact',
+        'view_company', 'add_company', 'change_company', 'delete_company',
+        'view_opportunity', 'add_opportunity', 'change_opportunity', 'delete_opportunity',
+        'view_salesstage', 'add_salesstage', 'change_salesstage',
+        'view_opportunityhistory',
+    }),
+    # Sales team gets contact and opportunity permissions
+    'sales': frozenset({
+        'view_contact', 'add_contact', 'change_contact',
+        'view_company', 'add_company', 'change_company',
+        'view_opportunity', 'add_opportunity', 'change_opportunity',
+        'view_salesstage',
+        'view_opportunityhistory', 'add_opportunityhistory',
+    }),
+    # Support gets view/change permissions for contacts
+    'support': frozenset({
+        'view_contact', 'change_contact',
+        'view_company',
+        'view_opportunity',
+        'view_opportunityhistory',
+    }),
+    # Basic users get view-only permissions
+    'basic': frozenset({
+        'view_contact',
+        'view_company',
+        'view_opportunity',
+        'view_opportunityhistory',
+    }),
+}
+
 
 class Command(BaseCommand):
     help = 'Complete seed data: creates superuser, tenant with users, groups, permissions, and sample data including opportunities'
@@ -128,108 +192,56 @@ class Command(BaseCommand):
 
     def create_groups(self):
         """Create tenant groups with appropriate permissions"""
-        groups_data = {
-            'Admin': {
-                'description': 'Full tenant administration access',
-                'permissions': 'all_tenant'
-            },
-            'Manager': {
-                'description': 'Management level access',
-                'permissions': 'management'
-            },
-            'Sales': {
-                'description': 'Sales team access',
-                'permissions': 'sales'
-            },
-            'Support': {
-                'description': 'Customer support access',
-                'permissions': 'support'
-            },
-            'User': {
-                'description': 'Basic user access',
-                'permissions': 'basic'
-            }
+        # One existence check, one INSERT and one SELECT instead of get_or_create per group
+        existing_names = set(
+            Group.objects.filter(name__in=DEFAULT_GROUPS).values_list('name', flat=True)
+        )
+        Group.objects.bulk_create(
+            [Group(name=name) for name in DEFAULT_GROUPS if name not in existing_names],
+            ignore_conflicts=True
+        )
+        created_groups = {
+            group.name: group
+            for group in Group.objects.filter(name__in=DEFAULT_GROUPS)
         }
         
-        created_groups = {}
+        new_group_names = [name for name in DEFAULT_GROUPS if name not in existing_names]
         
-        for group_name, group_info in groups_data.items():
-            group, created = Group.objects.get_or_create(name=group_name)
-            
-            if created:
-                self.assign_permissions_to_group(group, group_info['permissions'])
+        if new_group_names:
+            # New groups start empty, so write every group-permission row in one INSERT
+            permissions_by_level = self.partition_permissions()
+            GroupPermission = Group.permissions.through
+            GroupPermission.objects.bulk_create(
+                [
+                    GroupPermission(group=created_groups[name], permission=permission)
+                    for name in new_group_names
+                    for permission in permissions_by_level[DEFAULT_GROUPS[name]['permissions']]
+                ],
+                ignore_conflicts=True
+            )
+        
+        for group_name in DEFAULT_GROUPS:
+            if group_name not in existing_names:
                 self.stdout.write(f'✅ Created group: {group_name}')
             else:
                 self.stdout.write(f'⏭️  Group {group_name} already exists')
-            
-            created_groups[group_name] = group
         
         return created_groups
 
-    def assign_permissions_to_group(self, group, permission_level):
-        """Assign permissions based on the permission level"""
-        all_permissions = Permission.objects.all()
-        
-        if permission_level == 'all_tenant':
-            # Admin gets all tenant permissions except superuser-only ones
-            tenant_permissions = all_permissions.exclude(
-                codename__in=[
-                    'add_tenant', 'change_tenant', 'delete_tenant', 'view_tenant',
-                    'add_domain', 'change_domain', 'delete_domain', 'view_domain',
-                ]
-            )
-            group.permissions.set(tenant_permissions)
-            
-        elif permission_level == 'management':
-            # Managers get user and content management permissions
-            manager_permissions = all_permissions.filter(
-                codename__in=[
-                    'view_customuser', 'add_customuser', 'change_customuser',
-                    'view_contact', 'add_contact', 'change_contact', 'delete_contact',
-                    'view_company', 'add_company', 'change_company', 'delete_company',
-                    'view_opportunity', 'add_opportunity', 'change_opportunity', 'delete_opportunity',
-                    'view_salesstage', 'add_salesstage', 'change_salesstage',
-                    'view_opportunityhistory',
-                ]
-            )
-            group.permissions.set(manager_permissions)
-            
-        elif permission_level == 'sales':
-            # Sales team gets contact and opportunity permissions
-            sales_permissions = all_permissions.filter(
-                codename__in=[
-                    'view_contact', 'add_contact', 'change_contact',
-                    'view_company', 'add_company', 'change_company',
-                    'view_opportunity', 'add_opportunity', 'change_opportunity',
-                    'view_salesstage',
-                    'view_opportunityhistory', 'add_opportunityhistory',
-                ]
-            )
-            group.permissions.set(sales_permissions)
-            
-        elif permission_level == 'support':
-            # Support gets view/change permissions for contacts
-            support_permissions = all_permissions.filter(
-                codename__in=[
-                    'view_contact', 'change_contact',
-                    'view_company',
-                    'view_opportunity',
-                    'view_opportunityhistory',
-                ]
-            )
-            group.permissions.set(support_permissions)
-            
-        elif permission_level == 'basic':
-            # Basic users get view-only permissions
-            basic_permissions = all_permissions.filter(
-                codename__in=[
-                    'view_contact',
-                    'view_company',
-                    'view_opportunity',
-                    'view_opportunityhistory',
-                ]
-            )
-            group.permissions.set(basic_permissions)
+    def partition_permissions(self):
+        """Fetch permissions once and split them by permission level in a single pass"""
+        partitions = {'all_tenant': []}
+        partitions.update({level: [] for level in LEVEL_PERMISSION_CODENAMES})
+        
+        for permission in Permission.objects.only('id', 'codename'):
+            codename = permission.codename
+            if codename not in SUPERUSER_ONLY_CODENAMES:
+                partitions['all_tenant'].append(permission)
+            for level, codenames in LEVEL_PERMISSION_CODENAMES.items():
+                if codename in codenames:
+                    partitions[level].append(permission)
+        
+        return partitions
 
     def create_users(self, groups):
         """Create sample users and assign to groups"""
@@ -272,30 +284,41 @@ class Command(BaseCommand):
             },
         ]
         
-        created_users = []
-        admin_credentials = None
+        existing_emails = set(
+            TenantUser.objects.filter(
+                email__in=[user_data['email'] for user_data in users_data]
+            ).values_list('email', flat=True)
+        )
+        new_users_data = [
+            user_data for user_data in users_data
+            if user_data['email'] not in existing_emails
+        ]
         
-        for user_data in users_data:
-            # Check if user already exists
-            if TenantUser.objects.filter(email=user_data['email']).exists():
-                self.stdout.write(f'⏭️  User {user_data["email"]} already exists')
-                continue
-            
-            # Create user
-            user = TenantUser.objects.create_user(
-                email=user_data['email'],
-                password=user_data['password'],
-                first_name=user_data['first_name'],
-                last_name=user_data['last_name'],
-                is_admin=user_data.get('is_admin', False),
-            )
-            
-            # Assign to groups
-            for group_name in user_data['groups']:
-                if group_name in groups:
-                    user.groups.add(groups[group_name])
-            
-            created_users.append(user)
+        for email in existing_emails:
+            self.stdout.write(f'⏭️  User {email} already exists')
+        
+        # One INSERT for the users and one for their group memberships
+        created_users = TenantUser.objects.bulk_create_users([
+            {
+                'email': user_data['email'],
+                'password': user_data['password'],
+                'first_name': user_data['first_name'],
+                'last_name': user_data['last_name'],
+                'is_admin': user_data.get('is_admin', False),
+            }
+            for user_data in new_users_data
+        ])
+        
+        UserGroup = TenantUser.groups.through
+        UserGroup.objects.bulk_create([
+            UserGroup(customuser=user, group=groups[group_name])
+            for user, user_data in zip(created_users, new_users_data)
+            for group_name in user_data['groups']
+            if group_name in groups
+        ])
+        
+        admin_credentials = None
+        for user, user_data in zip(created_users, new_users_data):
             self.stdout.write(f'✅ Created user: {user.email}')
             
             # Store admin credentials
@@ -370,9 +393,9 @@ class Command(BaseCommand):
         # Get the admin user for created_by field
         admin_user = TenantUser.objects.filter(email='admin@acme.com').first()
         
-        created_stages = []
-        for stage_data in default_stages:
-            stage = SalesStage.objects.create(
+        # Probabilities above already match what SalesStage.save() would enforce
+        created_stages = SalesStage.objects.bulk_create([
+            SalesStage(
                 name=stage_data['name'],
                 description=stage_data['description'],
                 order=stage_data['order'],
@@ -382,7 +405,9 @@ class Command(BaseCommand):
                 is_closed_lost=stage_data.get('is_closed_lost', False),
                 created_by=admin_user
             )
-            created_stages.append(stage)
+            for stage_data in default_stages
+        ])
+        for stage in created_stages:
             self.stdout.write(f'✅ Created stage: {stage.name}')
         
         self.stdout.write(f'📈 Created {len(created_stages)} default sales stages')
@@ -792,10 +817,10 @@ class Command(BaseCommand):
             }
         ]
         
-        created_types = []
-        for type_data in activity_types_data:
-            activity_type = ActivityType.objects.create(**type_data)
-            created_types.append(activity_type)
+        created_types = ActivityType.objects.bulk_create(
+            [ActivityType(**type_data) for type_data in activity_types_data]
+        )
+        for activity_type in created_types:
             self.stdout.write(f'✅ Created activity type: {activity_type.name}')
         
         return created_types
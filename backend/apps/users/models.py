@@ -1,3 +1,6 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from django.contrib.auth.hashers import get_hasher, make_password
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin, BaseUserManager
 from django.db import models
 
@@ -15,6 +18,31 @@ class TenantUserManager(BaseUserManager):
     def create_superuser(self, email, password=None, **extra_fields):
         extra_fields.setdefault('is_admin', True)
         return self.create_user(email, password, **extra_fields)
+    
+    def bulk_create_users(self, rows, batch_size=500):
+        """Create many users in one INSERT, hashing passwords concurrently"""
+        rows = [dict(row) for row in rows]
+        for row in rows:
+            if not row.get('email'):
+                raise ValueError('Email is required')
+        
+        # Resolve the hasher once; PBKDF2 releases the GIL, so hashing parallelizes across threads
+        hasher = get_hasher()
+        
+        def hash_password(password):
+            if password is None:
+                return make_password(None)
+            return hasher.encode(password, hasher.salt())
+        
+        with ThreadPoolExecutor() as executor:
+            hashes = list(executor.map(hash_password, [row.pop('password', None) for row in rows]))
+        
+        # bulk_create skips save(), so lowercase the email here
+        users = [
+            self.model(email=self.normalize_email(row.pop('email')).lower(), password=password_hash, **row)
+            for row, password_hash in zip(rows, hashes)
+        ]
+        return self.bulk_create(users, batch_size=batch_size)
 
 
 class CustomUser(AbstractBaseUser, PermissionsMixin):
@@ -47,6 +75,9 @@ class CustomUser(AbstractBaseUser, PermissionsMixin):
         verbose_name = "Tenant User"
         verbose_name_plural = "Tenant Users"
         ordering = ['email']
+        indexes = [
+            models.Index(fields=['-date_joined']),
+        ]
     
     def __str__(self):
         admin_status = " (Admin)" if self.is_admin else ""
@@ -56,6 +87,9 @@ class CustomUser(AbstractBaseUser, PermissionsMixin):
     def full_name(self):
         return f"{self.first_name} {self.last_name}".strip()
     
+    def get_full_name(self):
+        return self.full_name
+    
     def save(self, *args, **kwargs):
         self.email = self.email.lower()
         super().save(*args, **kwargs)
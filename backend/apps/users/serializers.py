@@ -3,10 +3,7 @@ from .models import CustomUser
 
 
 class UserSerializer(serializers.ModelSerializer):
-    full_name = serializers.SerializerMethodField()
-    
-    def get_full_name(self, obj):
-        return f"{obj.first_name} {obj.last_name}".strip() if obj.first_name or obj.last_name else ""
+    full_name = serializers.CharField(read_only=True)
     
     class Meta:
         model = CustomUser
@@ -30,10 +27,7 @@ class UserCreateSerializer(serializers.ModelSerializer):
     
     def create(self, validated_data):
         password = validated_data.pop('password')
-        user = CustomUser.objects.create_user(**validated_data)
-        user.set_password(password)
-        user.save()
-        return user
+        return CustomUser.objects.create_user(password=password, **validated_data)
 
 
 class UserUpdateSerializer(serializers.ModelSerializer):
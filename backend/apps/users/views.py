@@ -9,7 +9,10 @@ class UserListCreateView(generics.ListCreateAPIView):
     permission_classes = [permissions.IsAuthenticated]
     
     def get_queryset(self):
-        return CustomUser.objects.all()
+        # Skip password and preferences, which the list never serializes
+        return CustomUser.objects.only(
+            *(field for field in UserSerializer.Meta.fields if field != 'full_name')
+        )
     
     def get_serializer_class(self):
         if self.request.method == 'POST':
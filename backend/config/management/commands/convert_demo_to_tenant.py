@@ -100,47 +100,50 @@ class Command(BaseCommand):
             command_content = f'''
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group, Permission
+from django.db import transaction
 
 User = get_user_model()
 
-# Create admin group with all tenant permissions (non-superuser)
-admin_group, created = Group.objects.get_or_create(name='Admin')
+# Provision the group and admin user in one transaction
+with transaction.atomic():
+    # Create admin group with all tenant permissions (non-superuser)
+    admin_group, created = Group.objects.get_or_create(name='Admin')
 
-if created:
-    # Get all permissions for tenant apps, excluding superuser-only permissions
-    tenant_permissions = Permission.objects.filter(
-        content_type__app_label__in=[
-            'users', 'auth', 'sessions'
-        ]
-    ).exclude(
-        codename__in=[
-            'add_permission', 'change_permission', 'delete_permission',
-            'add_contenttype', 'change_contenttype', 'delete_contenttype'
-        ]
-    )
+    if created:
+        # Get all permissions for tenant apps, excluding superuser-only permissions
+        tenant_permissions = Permission.objects.filter(
+            content_type__app_label__in=[
+                'users', 'auth', 'sessions'
+            ]
+        ).exclude(
+            codename__in=[
+                'add_permission', 'change_permission', 'delete_permission',
+                'add_contenttype', 'change_contenttype', 'delete_contenttype'
+            ]
+        )
     
-    admin_group.permissions.set(tenant_permissions)
-    print(f"Created Admin group in {schema_name} with {{tenant_permissions.count()}} permissions")
+        admin_group.permissions.set(tenant_permissions)
+        print(f"Created Admin group in {schema_name} with {{tenant_permissions.count()}} permissions")
 
-# Create admin user
-if not User.objects.filter(email="{admin_email}").exists():
-    admin_user = User.objects.create_user(
-        email="{admin_email}",
-        password="{admin_password}",
-        first_name="{demo.first_name}",
-        last_name="{demo.last_name}",
-        user_type='admin',
-        is_staff=False,
-        is_superuser=False,
-        is_tenant_admin=True,
-        job_title="{demo.job_title}",
-        phone_number="{demo.phone}"
-    )
-    admin_user.groups.add(admin_group)
+    # Create admin user
+    if not User.objects.filter(email="{admin_email}").exists():
+        admin_user = User.objects.create_user(
+            email="{admin_email}",
+            password="{admin_password}",
+            first_name="{demo.first_name}",
+            last_name="{demo.last_name}",
+            user_type='admin',
+            is_staff=False,
+            is_superuser=False,
+            is_tenant_admin=True,
+            job_title="{demo.job_title}",
+            phone_number="{demo.phone}"
+        )
+        admin_user.groups.add(admin_group)
     
-    print(f"Created tenant admin: {{admin_user.email}}")
-else:
-    print(f"Admin user {admin_email} already exists")
+        print(f"Created tenant admin: {{admin_user.email}}")
+    else:
+        print(f"Admin user {admin_email} already exists")
 '''
             
             # Execute the command in tenant schema using shell
@@ -42,6 +42,9 @@ class Command(BaseCommand):
         # Run migrations for this tenant
         self.stdout.write('🔄 Running tenant migrations...')
         from django.core.management import call_command
-        call_command('migrate_schemas', schema_name=schema_name, verbosity=1)
+        call_command(
+            'migrate_schemas', tenant=True, schema_name=schema_name,
+            verbosity=0, interactive=False
+        )
         
         self.stdout.write(self.style.SUCCESS('🎉 Tenant setup complete!'))